@@ -1,5 +1,8 @@
+import sys
 import time
+import threading
 import itertools as it
+from collections import deque
 
 # Define Sudoku variables and constraints
 variables = [f"{col}{row}" for row in "123456789" for col in "ABCDEFGHI"]
@@ -20,69 +23,241 @@ constraints = [
     for c in range(0, 9, 3)
 ]
 
+# The solver works on integer cell indices 0..80 (the position of the cell in `variables`)
+# so the board is a flat list of 81 masks; the "A1" names only appear when reading a board
+# file or printing. Precomputed at import time: the constraints as index tuples, the three
+# units (row, column and block) each cell belongs to, and the 20 unique peers it shares a
+# unit with. Propagation walks peers[cell] directly instead of scanning all 27 constraints.
+cell_index = {cell: index for index, cell in enumerate(variables)}
+constraints_idx = tuple(tuple(cell_index[cell] for cell in constraint)
+                        for constraint in constraints)
+units = tuple(tuple(constraint for constraint in constraints_idx if cell in constraint)
+              for cell in range(81))
+peers = tuple(tuple(sorted(set(it.chain.from_iterable(units[cell])) - {cell}))
+              for cell in range(81))
+
+# Each cell's domain is a 9-bit mask where bit d-1 set means digit d is still possible.
+FULL_DOMAIN = 0x1FF  # All nine digits possible
+
+# 512-entry tables over every possible 9-bit mask, so the hot loops answer "how many
+# candidates", "which digit is the lowest candidate" and "is exactly one left" with a
+# single bytes lookup instead of bin()/bit_length() calls.
+POPCNT = bytes(bin(mask).count("1") for mask in range(512))
+LOWBIT_DIGIT = bytes((mask & -mask).bit_length() for mask in range(512))
+SINGLETON = bytes(1 if mask and mask & (mask - 1) == 0 else 0 for mask in range(512))
+
+
+def _build_propagators():
+    """
+    Generates one specialized propagation function per cell, with the updates of its
+    20 peers unrolled as straight-line code and the peer indices baked in as constants.
+    The fast propagation loop dispatches through the resulting table, paying no
+    per-peer loop or lookup overhead.
+
+    Returns:
+        tuple: 81 functions; each takes (varsValues, bit, inv, trail, buckets, queue)
+                and returns False as soon as a peer runs out of candidates.
+    """
+    namespace = {"POPCNT": POPCNT, "SINGLETON": SINGLETON}
+    table = []
+    for cell in range(81):
+        lines = [f"def _propagate_at_{cell}(varsValues, bit, inv, trail, buckets, queue):"]
+        for peer in peers[cell]:
+            lines += [
+                f"    o = varsValues[{peer}]",
+                f"    if o & bit:",
+                f"        n = o & inv",
+                f"        varsValues[{peer}] = n",
+                f"        trail.append(({peer}, bit))",
+                f"        buckets[POPCNT[o]].discard({peer})",
+                f"        buckets[POPCNT[n]].add({peer})",
+                f"        if n == 0:",
+                f"            return False",
+                f"        if SINGLETON[n]:",
+                f"            queue.append(({peer}, n))",
+            ]
+        lines.append("    return True")
+        exec("\n".join(lines), namespace)
+        table.append(namespace[f"_propagate_at_{cell}"])
+    return tuple(table)
+
+
+_PROPAGATE_AT = _build_propagators()
+
+
+def digits_of(mask):
+    """
+    Returns the digits encoded in a domain bitmask as a sorted list.
+
+    Args:
+        mask (int): 9-bit domain bitmask of a cell.
+
+    Returns:
+        list: Digits between 1 and 9 whose bit is set in the mask.
+    """
+    return [d for d in range(1, 10) if mask & (1 << (d - 1))]
+
 
-def load_board(verbose=False):
+def load_board(filePath="a", verbose=False):
     """
     Reads an input file to initialize the Sudoku board.
-    The cells are loaded from the "board" file with values between 1 and 9.
+    The cells are loaded from the board file with values between 1 and 9.
 
     Args:
+        filePath (str): Path of the board file to read.
         verbose (bool): If True, shows information about each initialized cell.
 
     Returns:
-        dict: A dictionary of possible values for each cell. If the value of a cell is defined
-                in the input file, the set contains only that value, otherwise it contains all values from
-                1 to 9.
+        list: A list of 81 domain bitmasks, one per cell in `variables` order. If the value
+                of a cell is defined in the input file, only that digit's bit is set,
+                otherwise all bits from 1 to 9 are set.
     """
-    varsValues = {f"{col}{row}": set(range(1, 10))
-                  for row, col in it.product("123456789", "ABCDEFGHI")}
-    filePath = "a"
+    varsValues = [FULL_DOMAIN] * 81
     with open(filePath) as board_fd:
-        for key in varsValues:
+        for cellId in range(81):
             keyValue = int(board_fd.readline().strip())
             if keyValue < 10:
-                varsValues[key] = {keyValue}
+                varsValues[cellId] = 1 << (keyValue - 1)
                 if verbose:
-                    print(f"Initializing: {key} = {keyValue}")
+                    print(f"Initializing: {variables[cellId]} = {keyValue}")
     return varsValues
 
 
 def apply_constraints(varsValues, verbose=False):
     """
-    Iterate through the constrained cells, looking for cells with a single value and removing that value from its peers.
+    Trims the domains to a fixpoint with a worklist of solved cells, in the style of AC-3.
+    Solved cells are queued and their value removed from the domains of their peers; peers
+    reduced to a single value are queued in turn. Whenever the queue drains, a unit pass
+    applies hidden singles, naked pairs and hidden pairs and reseeds the queue with any
+    cell it solved.
 
     Args:
-        varsValues (dict): Dictionary of possible values for each cell.
+        varsValues (list): Domain bitmasks for each cell.
         verbose (bool): If True, shows the values removed from each cell.
 
     Returns:
-        dict: Updated dictionary of possible values for each cell.
-    """
-    dirty = True
-    while dirty:
-        dirty = False
-        for constraint in constraints:
-            for cellId in constraint:
-                # This cell has been solved, remove the value from its peers possible values.
-                if len(varsValues[cellId]) == 1:
-                    # Get the single value
-                    unique_value = next(iter(varsValues[cellId]))
+        list or None: Updated domain bitmasks for each cell, or None if a contradiction
+                is found.
+    """
+    queue = deque(cellId for cellId in range(81)
+                  if varsValues[cellId] & (varsValues[cellId] - 1) == 0)
+    while True:
+        while queue:
+            cellId = queue.popleft()
+            mask = varsValues[cellId]
+            # This cell has been solved, remove the value from its peers possible values.
+            for key in peers[cellId]:
+                if varsValues[key] & mask:
+                    new_mask = varsValues[key] & ~mask
+                    varsValues[key] = new_mask
+                    if verbose:
+                        print(f"Removing {LOWBIT_DIGIT[mask]} from {variables[key]} "
+                              f"due to {variables[cellId]} = {LOWBIT_DIGIT[mask]}")
+                    if new_mask == 0:
+                        return None
+                    if SINGLETON[new_mask]:
+                        queue.append(key)
+
+        # Unit-level deductions: hidden singles, naked pairs and hidden pairs. Repeated
+        # until neither the deductions nor the queue have anything left to do.
+        changed = False
+        for constraint in constraints_idx:
+            # Digit-parallel unit scan: a single pass computes, for all nine digits at
+            # once, which of them still fit in at least one, two or three cells of the
+            # unit. The per-digit counting loops only run for the few digits that the
+            # accumulators single out.
+            once = twice = thrice = 0
+            for key in constraint:
+                mask = varsValues[key]
+                thrice |= twice & mask
+                twice |= once & mask
+                once |= mask
+            if once != FULL_DOMAIN:
+                return None  # Some digit has no cell left in this unit
+
+            # Hidden singles: a digit that fits in only one cell of a unit must go there.
+            exactly_once = once & ~twice
+            if exactly_once:
+                for key in constraint:
+                    bit = varsValues[key] & exactly_once
+                    if bit:
+                        if bit & (bit - 1):
+                            return None  # Two digits forced into the same cell
+                        if varsValues[key] != bit:
+                            varsValues[key] = bit
+                            changed = True
+                            if verbose:
+                                print(f"Hidden single: {variables[key]} = {LOWBIT_DIGIT[bit]} in its unit")
+                            queue.append(key)
+
+            # Hidden pairs: two digits confined to the same two cells of a unit reduce
+            # those cells to exactly that pair of digits. Only digits the scan found in
+            # exactly two cells qualify.
+            pair_holders = {}
+            exactly_twice = twice & ~thrice
+            for d in range(9):
+                bit = 1 << d
+                if exactly_twice & bit:
+                    holders = tuple(key for key in constraint if varsValues[key] & bit)
+                    if len(holders) == 2:
+                        pair_holders[holders] = pair_holders.get(holders, 0) | bit
+            for holders, pair_mask in pair_holders.items():
+                if POPCNT[pair_mask] == 2:
+                    for key in holders:
+                        if varsValues[key] != pair_mask:
+                            varsValues[key] = pair_mask
+                            changed = True
+                            if verbose:
+                                print(f"Hidden pair: {variables[key]} reduced to {digits_of(pair_mask)}")
+
+            # Naked pairs: two cells of a unit sharing the same two-candidate domain
+            # exclude those digits from the rest of the unit.
+            mask_holders = {}
+            for key in constraint:
+                mask_holders.setdefault(varsValues[key], []).append(key)
+            for pair_mask, holders in mask_holders.items():
+                if len(holders) == 2 and POPCNT[pair_mask] == 2:
                     for key in constraint:
-                        if key != cellId and unique_value in varsValues[key]:
-                            varsValues[key].discard(unique_value)
-                            dirty = True  # Prompt another iteration due to the change in the possible values
+                        if key not in holders and varsValues[key] & pair_mask:
+                            new_mask = varsValues[key] & ~pair_mask
+                            varsValues[key] = new_mask
+                            changed = True
                             if verbose:
-                                print(f"Removing {unique_value} from {
-                                      key} due to {cellId} = {unique_value}")
-    return varsValues
+                                print(f"Naked pair {digits_of(pair_mask)}: trimming {variables[key]}")
+                            if new_mask == 0:
+                                return None
+                            if SINGLETON[new_mask]:
+                                queue.append(key)
+        if not changed and not queue:
+            return varsValues
 
 
 def move(y, x):
-    import sys
     sys.stdout.write("\033[%d;%dH" % (y, x))
 
 
-def look_forward(varsValues, verbose=False, step_by_step=False):
+def _render_events(events, stop):
+    """
+    Renderer thread: applies queued (cell, mask) events to its own copy of the board
+    and redraws it at most about 30 times per second. The solver only appends to
+    `events` and never blocks on terminal output.
+    """
+    board = [FULL_DOMAIN] * 81
+    while True:
+        changed = False
+        while events:
+            cellId, mask = events.popleft()
+            board[cellId] = mask
+            changed = True
+        if changed:
+            move(0, 0)
+            stylized_board(board)
+        if stop.is_set() and not events:
+            return
+        time.sleep(1 / 30)
+
+
+def look_forward(varsValues, verbose=False, step_by_step=False, trail=None, buckets=None):
     """
     Look-forward algorithm to solve the Sudoku by assigning values and propagating constraints.
     The algorithm takes a recursive approach to solve the board, backtracking if a dead-end is reached.
@@ -92,105 +267,299 @@ def look_forward(varsValues, verbose=False, step_by_step=False):
     last decision where the path was viable and tries the next possible value.
 
     Args:
-        VarsValues (dict): Dictionary of possible values for each cell.
+        VarsValues (list): Domain bitmasks for each cell.
         verbose (bool): If True, shows the details of each assignment and propagation.
-        step_by_step (bool): If True, shows the board at each step and dramatically pause between steps.
+        step_by_step (bool): If True, streams the board to a background renderer that
+                redraws it at most about 30 times per second.
+        trail (list or None): Undo log of (cell, removed_bits) entries shared across the recursion.
+        buckets (list or None): Cells grouped by domain size, shared across the recursion;
+                buckets[k] holds the cells whose domain currently has k candidates.
 
     Returns:
-        dict or None: Dictionary with the complete solution if found, or None if no solution is found.
+        list or None: Domain bitmasks of the complete solution if found, or None if no solution is found.
     """
-    if step_by_step:
-        move(0, 0)
-        stylized_board(varsValues)
-        time.sleep(0.5)
-    unassigned_vars = [var for var in varsValues if len(varsValues[var]) > 1]
-    if not unassigned_vars:
+    if trail is None:
+        trail = []
+        buckets = [set() for _ in range(10)]
+        for cellId in range(81):
+            buckets[POPCNT[varsValues[cellId]]].add(cellId)
+    # Dispatch once to the variant matching the diagnostic flags; the fast
+    # variant carries no flag checks at all in its loops.
+    if verbose or step_by_step:
+        events = renderer = None
+        if step_by_step:
+            # Seed the renderer with the current board, then stream every domain
+            # change to it; drawing happens off the solving thread, throttled.
+            events = deque((cellId, varsValues[cellId]) for cellId in range(81))
+            stop = threading.Event()
+            renderer = threading.Thread(target=_render_events, args=(events, stop), daemon=True)
+            renderer.start()
+        try:
+            return _look_forward_verbose(varsValues, verbose, trail, buckets, events)
+        finally:
+            if renderer is not None:
+                stop.set()
+                renderer.join()
+    return _look_forward_fast(varsValues, trail, buckets)
+
+
+def _undo_trail(varsValues, trail, buckets, mark, events=None):
+    """
+    Rolls the board back to a trail mark: the removed bits are restored newest
+    entries first, keeping the size buckets in sync. Restores are streamed to
+    `events` when a renderer is attached.
+    """
+    for i in range(len(trail) - 1, mark - 1, -1):
+        cell, removed = trail[i]
+        old_mask = varsValues[cell]
+        new_mask = old_mask | removed
+        varsValues[cell] = new_mask
+        buckets[POPCNT[old_mask]].discard(cell)
+        buckets[POPCNT[new_mask]].add(cell)
+        if events is not None:
+            events.append((cell, new_mask))
+    del trail[mark:]
+
+
+def _look_forward_fast(varsValues, trail, buckets):
+    """
+    Hot-path variant of look_forward with all diagnostic output removed.
+    The depth-first search runs on an explicit stack of (cell, remaining candidate
+    mask, trail mark) entries, so a search node costs no Python stack frame and the
+    tree depth is not bounded by the recursion limit.
+    """
+    # Heuristic: select the cell with the fewest potential values, i.e. any
+    # member of the lowest non-empty bucket of unassigned cells.
+    chosen = None
+    for k in range(2, 10):
+        if buckets[k]:
+            chosen = next(iter(buckets[k]))
+            break
+    if chosen is None:
         return varsValues  # Solution found
 
-    # Heuristic: select the cell with the fewest potential values
-    chosen = min(unassigned_vars, key=lambda v: len(varsValues[v]))
+    stack = [(chosen, varsValues[chosen], len(trail))]
+    while stack:
+        chosen, candidates, mark = stack[-1]
+        if candidates == 0:
+            # Every value of this node failed; discard it and undo the parent
+            # branch that led here.
+            stack.pop()
+            _undo_trail(varsValues, trail, buckets, mark)
+            continue
+
+        # Peel the next candidate digit off the mask, lowest bit first.
+        bit = candidates & -candidates
+        stack[-1] = (chosen, candidates ^ bit, mark)
+
+        # Remember where this branch starts in the trail so it can be undone.
+        branch_mark = len(trail)
+        # Assign the value to the chosen cell, logging the candidates it discards
+        old_mask = varsValues[chosen]
+        trail.append((chosen, old_mask & ~bit))
+        buckets[POPCNT[old_mask]].discard(chosen)
+        buckets[1].add(chosen)
+        varsValues[chosen] = bit
 
-    if verbose:
-        print(f"\nSelecting {chosen} with possible values: {
-              varsValues[chosen]}. {len(unassigned_vars)} unassigned cells remaining.")
+        # Constraint propagation: remove the value from neighbors
+        if _propagate_constraints_fast(varsValues, chosen, LOWBIT_DIGIT[bit], trail, buckets):
+            # The branch is viable: descend into the next most constrained cell.
+            chosen = None
+            for k in range(2, 10):
+                if buckets[k]:
+                    chosen = next(iter(buckets[k]))
+                    break
+            if chosen is None:
+                return varsValues  # Solution found
+            stack.append((chosen, varsValues[chosen], branch_mark))
+        else:
+            # Dead end: undo the branch and try the next value of this node.
+            _undo_trail(varsValues, trail, buckets, branch_mark)
 
-    # Evaluate the viability of assigning each possible value to the chosen cell
-    for value in varsValues[chosen].copy():
-        if verbose:
-            print(f"Trying to assign {chosen} = {value}")
+    # There is not possible solution to the current board.
+    return None
 
-        # Deep copy the board dictionary to avoid modifying the original
-        new_varsValues = {k: v.copy() for k, v in varsValues.items()}
-        # Assign the value to the chosen cell
-        new_varsValues[chosen] = {value}
+
+def _look_forward_verbose(varsValues, verbose, trail, buckets, events):
+    """
+    Variant of look_forward that emits the verbose output and streams board
+    changes to the renderer events queue when one is attached.
+    """
+    # Heuristic: select the cell with the fewest potential values, i.e. any
+    # member of the lowest non-empty bucket of unassigned cells.
+    chosen = None
+    for k in range(2, 10):
+        if buckets[k]:
+            chosen = next(iter(buckets[k]))
+            break
+    if chosen is None:
+        return varsValues  # Solution found
+
+    if verbose:
+        unassigned = sum(len(bucket) for bucket in buckets[2:])
+        print(f"\nSelecting {variables[chosen]} with possible values: {digits_of(varsValues[chosen])}. "
+              f"{unassigned} unassigned cells remaining.")
+
+    # Evaluate the viability of assigning each possible value to the chosen cell,
+    # peeling candidate digits off the mask lowest bit first.
+    candidates = varsValues[chosen]
+    while candidates:
+        bit = candidates & -candidates
+        candidates ^= bit
+        value = LOWBIT_DIGIT[bit]
+        if verbose:
+            print(f"Trying to assign {variables[chosen]} = {value}")
+
+        # Remember where this branch starts in the trail so it can be undone.
+        mark = len(trail)
+        # Assign the value to the chosen cell, logging the candidates it discards
+        old_mask = varsValues[chosen]
+        trail.append((chosen, old_mask & ~bit))
+        buckets[POPCNT[old_mask]].discard(chosen)
+        buckets[1].add(chosen)
+        varsValues[chosen] = bit
+        if events is not None:
+            events.append((chosen, bit))
 
         # Constraint propagation: remove the value from neighbors
-        if propagate_constraints(new_varsValues, chosen, value, verbose, step_by_step):
+        if _propagate_constraints_verbose(varsValues, chosen, value, trail, buckets, verbose, events):
             # This value it's valid for the immediate step
-            result = look_forward(new_varsValues, verbose, step_by_step)
+            result = _look_forward_verbose(varsValues, verbose, trail, buckets, events)
             if result:
                 # The path leads to a valid solution
                 return result  # Complete solution found
             # If the path leads to a dead-end, try the next value
 
+        # Undo the branch: restore the removed bits, newest entries first.
+        _undo_trail(varsValues, trail, buckets, mark, events)
+
     # There is not possible solution to the current board.
     return None
 
 
-def propagate_constraints(varsValues, var, value, verbose=False, step_by_step=False):
+def propagate_constraints(varsValues, var, value, trail, buckets, verbose=False, step_by_step=False):
     """
     Propagates constraints by removing a value from the pool of possible values of the neighbors of a cell.
+    Peers reduced to a single value are pushed on a work queue and propagated in turn, so dense
+    propagation chains cost no recursive calls and cannot hit the recursion limit.
 
     Args:
-        varsValues (dict): Dictionary of possible values for each cell.
-        var (str): The cell to which the value was assigned.
+        varsValues (list): Domain bitmasks for each cell.
+        var (int): The cell to which the value was assigned.
         value (int): The value assigned to the cell `var`.
+        trail (list): Undo log; every bit removed from a peer is appended as (cell, bit).
+        buckets (list): Cells grouped by domain size, kept in sync as domains shrink.
         verbose (bool): If True, shows the details of each propagation.
-        step_by_step (bool): If True, shows the board at each step and dramatically pause between steps.
+        step_by_step (bool): Kept for compatibility; board rendering is handled by the
+                renderer thread that look_forward attaches, not by this function.
 
     Returns:
         bool: True if the propagation is successful, False if any cell is left without values.
     """
-    for constraint in constraints:
-        if var in constraint:
-            for peer in constraint:
-                if peer != var and value in varsValues[peer]:
-                    # Remove the value from the possible values of the peer cell.
-                    varsValues[peer].discard(value)
+    if verbose or step_by_step:
+        return _propagate_constraints_verbose(varsValues, var, value, trail, buckets, verbose, None)
+    return _propagate_constraints_fast(varsValues, var, value, trail, buckets)
+
+
+def _propagate_constraints_fast(varsValues, var, value, trail, buckets):
+    """
+    Hot-path variant of propagate_constraints with all diagnostic output removed.
+    The per-cell work is done by the generated functions in _PROPAGATE_AT, which
+    unroll the 20 peer updates of their cell as straight-line code.
+    """
+    propagate_at = _PROPAGATE_AT
+    queue = deque()
+    queue.append((var, 1 << (value - 1)))
+    while queue:
+        var, bit = queue.popleft()
+        if not propagate_at[var](varsValues, bit, ~bit, trail, buckets, queue):
+            return False
+    return True
+
+
+def _propagate_constraints_verbose(varsValues, var, value, trail, buckets, verbose, events):
+    """
+    Variant of propagate_constraints that emits the verbose output and streams board
+    changes to the renderer events queue when one is attached.
+    """
+    queue = deque()
+    queue.append((var, 1 << (value - 1)))
+    while queue:
+        var, bit = queue.popleft()
+        for peer in peers[var]:
+            old_mask = varsValues[peer]
+            if old_mask & bit:
+                # Remove the value from the possible values of the peer cell.
+                new_mask = old_mask & ~bit
+                varsValues[peer] = new_mask
+                trail.append((peer, bit))
+                buckets[POPCNT[old_mask]].discard(peer)
+                buckets[POPCNT[new_mask]].add(peer)
+                if events is not None:
+                    events.append((peer, new_mask))
+                if verbose:
+                    print(f"Propagating: removing {LOWBIT_DIGIT[bit]} from {variables[peer]}.")
+
+                # If a cell is left without possible values, stop propagation.
+                if new_mask == 0:
                     if verbose:
-                        print(f"Propagating: removing {value} from {peer}.")
-
-                    if step_by_step and len(varsValues[peer]) <= 1:
-                        move(0, 0)
-                        stylized_board(varsValues)
-                        if len(varsValues[peer]) == 0:
-                            time.sleep(1)
-                        else:
-                            time.sleep(0.1)
-
-                    # If a cell is left without possible values, stop propagation.
-                    if len(varsValues[peer]) == 0:
-                        if verbose:
-                            print(f"Error: assigning {value} to {var} leaves {
-                                  peer} without possible values.")
-                        return False
-                    # If a cell has a single value, propagate that value additionally.
-                    elif len(varsValues[peer]) == 1:
-                        next_value = next(iter(varsValues[peer]))
-                        if verbose:
-                            print(f"{peer} reduced to a single value {
-                                  next_value}.")
-                        if not propagate_constraints(varsValues, peer, next_value, verbose, step_by_step):
-                            return False
+                        print(f"Error: assigning {LOWBIT_DIGIT[bit]} to {variables[var]} "
+                              f"leaves {variables[peer]} without possible values.")
+                    return False
+                # If a cell has a single value, queue it to propagate that value additionally.
+                elif SINGLETON[new_mask]:
+                    if verbose:
+                        print(f"{variables[peer]} reduced to a single value {LOWBIT_DIGIT[new_mask]}.")
+                    queue.append((peer, new_mask))
     return True
 
 
+def solve(varsValues, verbose=False, step_by_step=False):
+    """
+    Solves a Sudoku board: trims the domains of the predefined cells and runs the look-forward search.
+    This is the single entry point for solving; callers only deal with the board list.
+
+    Args:
+        varsValues (list): Domain bitmasks for each cell, as returned by load_board.
+        verbose (bool): If True, shows the details of each assignment and propagation.
+        step_by_step (bool): If True, streams the board to a background renderer that
+                redraws it at most about 30 times per second.
+
+    Returns:
+        list or None: Domain bitmasks of the complete solution if found, or None if no solution is found.
+    """
+    varsValues = apply_constraints(varsValues, verbose)
+    if varsValues is None:
+        return None
+    return look_forward(varsValues, verbose, step_by_step)
+
+
+def solve_many(boards, processes=None):
+    """
+    Solves a batch of independent boards, distributing them across CPU cores.
+
+    Args:
+        boards (list): Boards to solve, each a list of 81 domain bitmasks.
+        processes (int or None): Number of worker processes; None uses the CPU count.
+                A batch of one board (or processes=1) is solved in-process.
+
+    Returns:
+        list: One entry per board, in order: the solved domain bitmasks, or None if
+                the board has no solution.
+    """
+    if len(boards) < 2 or processes == 1:
+        return [solve(board) for board in boards]
+    from multiprocessing import Pool
+    with Pool(processes) as pool:
+        return pool.map(solve, boards)
+
+
 def stylized_board(varsValues):
     """
     Prints the Sudoku board in a stylized format.
 
     Args:
-        varsValues (dict): Dictionary of possible values for each cell.
+        varsValues (list): Domain bitmasks for each cell.
     """
     horizontal_border = "╔═══════╦═══════╦═══════╗"
     middle_border = "╠═══════╬═══════╬═══════╣"
@@ -201,16 +570,16 @@ def stylized_board(varsValues):
     for i, row in enumerate(rows):
         row_values = []
         for col in cols:
-            cell_values = list(varsValues[f"{col}{row}"])
-            if len(cell_values) == 1:
-                row_values.append(str(cell_values[0]))
-            elif len(cell_values) == 0:
+            mask = varsValues[cell_index[f"{col}{row}"]]
+            if mask == 0:
                 row_values.append('!')
+            elif mask & (mask - 1) == 0:
+                row_values.append(str(LOWBIT_DIGIT[mask]))
             else:
                 row_values.append('.')
         row_values = " ".join(row_values)
-        print(f"{row_separator} {row_values[:5]} {row_separator} {
-              row_values[6:11]} {row_separator} {row_values[12:]} {row_separator}")
+        print(f"{row_separator} {row_values[:5]} {row_separator} "
+              f"{row_values[6:11]} {row_separator} {row_values[12:]} {row_separator}")
         if i == 2 or i == 5:
             print(middle_border)
     print(bottom_border)
@@ -221,22 +590,36 @@ def stylized_board(varsValues):
 verbose = False #activate to see the details of each step
 step_by_step = True #activate to see the board at each step
 
-if step_by_step:
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
-# Load the board from the input file
-varsValues = load_board(verbose)
-# Trim possible values based on the predefined cells in the board
-varsValues = apply_constraints(varsValues, verbose)
-# Solve the Sudoku
-solution = look_forward(varsValues, verbose, step_by_step)
-
-# Show solution
-if solution:
-    if not step_by_step:
-        print("\nSolution found:")
-        stylized_board(solution)
-else:
+if __name__ == "__main__":
+    import sys
+    # Every command line argument is a board file; with none, the classic "a" board.
+    board_files = sys.argv[1:] or ["a"]
+
+    if len(board_files) > 1:
+        # Batch mode: solve the boards in parallel and print them one after another.
+        boards = [load_board(filePath, verbose) for filePath in board_files]
+        for filePath, solution in zip(board_files, solve_many(boards)):
+            print(f"\n{filePath}:")
+            if solution:
+                stylized_board(solution)
+            else:
+                print("No solution found.")
+        sys.exit()
+
     if step_by_step:
-        move(0, 0)
-    print("No solution found.")
+        import os
+        os.system('cls' if os.name == 'nt' else 'clear')
+    # Load the board from the input file
+    varsValues = load_board(board_files[0], verbose)
+    # Solve the Sudoku
+    solution = solve(varsValues, verbose, step_by_step)
+
+    # Show solution
+    if solution:
+        if not step_by_step:
+            print("\nSolution found:")
+            stylized_board(solution)
+    else:
+        if step_by_step:
+            move(0, 0)
+        print("No solution found.")